@@ -3,13 +3,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from django.conf import settings
 
-from superapp.apps.backups.models.backup import Backup
-from superapp.apps.backups.tasks.backup import (
-    get_models_for_backup_type,
-    extract_media_files_from_fixture,
-    copy_media_files_to_backup,
-    create_backup_archive
-)
+from superapp.apps.backups.tasks.backup import create_backup_synchronously
 
 # Conditional imports for multi-tenant support
 try:
@@ -96,27 +90,26 @@ class Command(BaseCommand):
             self.stdout.write(f'Backup type: {backup_type}')
             self.stdout.write(f'File path: {file_path}')
 
-            # Create backup record
-            backup = Backup.objects.create(
+            # Run the shared synchronous backup pipeline
+            result = create_backup_synchronously(
+                backup_type=backup_type,
+                target_file_path=file_path,
+                tenant=tenant,
                 name=backup_name,
-                type=backup_type
             )
 
-            backup.started_at = timezone.now()
-            backup.save(update_fields=['started_at'])
-
-            # Use the synchronous backup creation logic
-            self._create_backup_synchronously(backup, file_path)
-
-            # Mark as completed
-            backup.finished_at = timezone.now()
-            backup.done = True
-            backup.save(update_fields=['finished_at', 'done'])
+            media_stats = result['media_stats']
+            self.stdout.write(f'Media files: {len(media_stats["copied"])} copied, '
+                            f'{len(media_stats["missing"])} missing')
+            if media_stats['missing']:
+                self.stdout.write(
+                    self.style.WARNING(f'Missing media files: {media_stats["missing"]}')
+                )
 
             self.stdout.write(
                 self.style.SUCCESS(f'Backup created successfully: {backup_name}')
             )
-            self.stdout.write(f'Backup ID: {backup.id}')
+            self.stdout.write(f'Backup ID: {result["backup_id"]}')
             self.stdout.write(f'File saved to: {file_path}')
 
         except Exception as e:
@@ -127,97 +120,3 @@ class Command(BaseCommand):
             # Clean up tenant context
             if MULTI_TENANT_ENABLED:
                 unset_current_tenant()
-
-    def _create_backup_synchronously(self, backup, target_file_path):
-        """
-        Create backup synchronously using the same logic as the Celery task
-        """
-        import tempfile
-        import os
-        import json
-        from pathlib import Path
-        from django.core.files.base import File
-        from django.core.management import call_command
-        from django.apps import apps
-
-        # Create target directory if it doesn't exist
-        target_path = Path(target_file_path)
-        target_dir = target_path.parent
-        if not target_dir.exists():
-            target_dir.mkdir(parents=True, exist_ok=True)
-            self.stdout.write(f'Created directory: {target_dir}')
-
-        # Get models to backup based on backup type
-        models_to_backup = get_models_for_backup_type(backup.type)
-
-        # If models_to_backup is '*', backup all models
-        if models_to_backup == '*':
-            args = []
-            for app_config in apps.get_app_configs():
-                for model in app_config.get_models():
-                    model_name = f"{model._meta.app_label}.{model._meta.model_name}"
-                    args.append(model_name)
-        else:
-            args = models_to_backup
-
-        self.stdout.write(f'Backing up models: {", ".join(args)}')
-
-        # Create a temporary directory for the backup process
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file_path = os.path.join(temp_dir, 'backup.json')
-
-            # Set up options for the dumpdata command
-            options = {
-                'output': temp_file_path,
-                'format': 'json',
-                'indent': 2,
-                'database': 'default',
-            }
-
-            # If multi-tenant is enabled and we have a tenant, use tenant-specific commands
-            tenant = getattr(backup, 'tenant', None) if MULTI_TENANT_ENABLED else None
-            if MULTI_TENANT_ENABLED and tenant:
-                options['tenant_pk'] = tenant.pk
-                call_command('tenant_dumpdata', *args, **options)
-            else:
-                call_command('dumpdata', *args, **options)
-
-            # Read the generated JSON file to extract media file references
-            with open(temp_file_path, 'r') as f:
-                fixture_data = json.load(f)
-
-            # Extract media files referenced in the fixture
-            media_files = extract_media_files_from_fixture(fixture_data)
-            self.stdout.write(f'Found {len(media_files)} media files referenced in backup')
-
-            # Copy media files to backup directory
-            media_copy_result = copy_media_files_to_backup(media_files, temp_dir)
-            self.stdout.write(f'Copied {len(media_copy_result["copied"])} media files, '
-                            f'{len(media_copy_result["missing"])} files were missing')
-
-            # Create archive name based on target file path
-            target_path = Path(target_file_path)
-            archive_name = target_path.stem
-
-            # Create zip archive with JSON data and media files
-            archive_path = create_backup_archive(temp_file_path, temp_dir, archive_name)
-
-            # Copy the archive to the target location
-            import shutil
-            shutil.copy2(archive_path, target_file_path)
-
-            # Also save to the backup model for record keeping
-            with open(archive_path, 'rb') as archive_file:
-                backup.file.save(
-                    name=f'{archive_name}.zip',
-                    content=File(archive_file),
-                    save=True
-                )
-
-            # Log backup statistics
-            self.stdout.write(f'Media files: {len(media_copy_result["copied"])} copied, '
-                            f'{len(media_copy_result["missing"])} missing')
-            if media_copy_result['missing']:
-                self.stdout.write(
-                    self.style.WARNING(f'Missing media files: {media_copy_result["missing"]}')
-                )
\ No newline at end of file
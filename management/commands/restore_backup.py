@@ -13,7 +13,8 @@ from superapp.apps.backups.tasks.restore import (
     extract_backup_archive,
     restore_media_files_after_loaddata,
     determine_backup_type,
-    _cleanup_existing_data_for_non_tenant_restore
+    _cleanup_existing_data_for_non_tenant_restore,
+    _iter_media_files
 )
 
 # Conditional imports for multi-tenant support
@@ -182,7 +183,7 @@ class Command(BaseCommand):
 
                 # Check if media directory exists
                 media_dir = Path(temp_dir) / 'media'
-                has_media_files = media_dir.exists() and any(media_dir.rglob('*'))
+                has_media_files = media_dir.exists() and any(_iter_media_files(media_dir))
                 self.stdout.write(f'Archive contains media files: {has_media_files}')
 
             else:
@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import models
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 from superapp.apps.backups.models.backup import Backup
@@ -23,12 +25,26 @@ except ImportError:
 class RestoreTypeChoices:
     """
     A callable class to provide backup type choices from Django settings.
-    This allows choices to be re-evaluated at runtime when needed.
+    The materialized choice list is cached after the first iteration, since
+    Django re-iterates choices on every model validation and form render,
+    and is invalidated when the BACKUPS setting changes.
     """
+    _choices = None
+
     def __iter__(self):
-        backup_types = getattr(settings, 'BACKUPS', {}).get('BACKUP_TYPES', {})
-        for key, backup_type in backup_types.items():
-            yield key, backup_type['name']
+        if RestoreTypeChoices._choices is None:
+            backup_types = getattr(settings, 'BACKUPS', {}).get('BACKUP_TYPES', {})
+            RestoreTypeChoices._choices = tuple(
+                (key, backup_type['name'])
+                for key, backup_type in backup_types.items()
+            )
+        return iter(RestoreTypeChoices._choices)
+
+
+@receiver(setting_changed)
+def _reset_restore_type_choices(sender, setting, **kwargs):
+    if setting == 'BACKUPS':
+        RestoreTypeChoices._choices = None
 
 
 class Restore(BaseModel):
@@ -40,6 +40,7 @@ def extend_superapp_settings(main_settings):
                     'RETENTION': {
                         'MAX_BACKUPS': 30,
                     },
+                    'MAX_PARALLEL_MEDIA_TRANSFERS': 16,
                 }
             },
             main_settings,
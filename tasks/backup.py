@@ -1,5 +1,9 @@
+import functools
 import logging
+import ijson
 from celery import shared_task
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import os
 import json
@@ -11,6 +15,8 @@ from django.conf import settings
 from django.core.files.base import ContentFile, File
 from django.core.files.storage import default_storage
 from django.core.management import call_command
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils import timezone
 from django.apps import apps
 from django.db import models
@@ -34,82 +40,271 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def extract_media_files_from_fixture(fixture_data):
+def iter_fixture_objects(file_obj):
     """
-    Extract media file paths from fixture data by examining FileField and ImageField values.
+    Stream fixture objects from a dumpdata JSON file one at a time.
+
+    The dumpdata output is a flat list of {model, pk, fields} objects, so an
+    event-driven parser keeps memory bounded regardless of fixture size.
+
+    Args:
+        file_obj: Binary file object containing the JSON fixture
+
+    Yields:
+        Parsed fixture objects (dicts)
+    """
+    yield from ijson.items(file_obj, 'item', use_float=True)
+
+
+def iter_media_paths(obj_stream):
+    """
+    Extract media file paths from a stream of fixture objects by examining
+    FileField and ImageField values.
 
     Args:
-        fixture_data: Parsed JSON fixture data
+        obj_stream: Iterable of fixture objects ({model, fields} dicts)
+
+    Yields:
+        Media file paths referenced in the fixture (may contain duplicates)
+    """
+    seen_raw = set()
+    for obj in obj_stream:
+        yield from _iter_object_media_paths(obj, seen_raw)
+
+
+@functools.lru_cache(maxsize=1)
+def _file_field_names_by_model():
+    """
+    Map each installed model label to the names of its FileField/ImageField
+    columns, covering only models that have at least one.
+
+    Most models carry no file fields, so the fixture scan can skip their
+    objects entirely with a single dict lookup. The app registry is frozen
+    once Django has started, so this is computed once per process.
 
     Returns:
-        Set of media file paths referenced in the fixture
+        Dict of {"app_label.model_name": frozenset of file-field names}
     """
-    media_files = set()
+    file_fields_by_model = {}
+    for model_class in apps.get_models():
+        field_names = frozenset(
+            field.name
+            for field in model_class._meta.get_fields()
+            if isinstance(field, (models.FileField, models.ImageField))
+        )
+        if field_names:
+            label = f"{model_class._meta.app_label}.{model_class._meta.model_name}"
+            file_fields_by_model[label] = field_names
+    return file_fields_by_model
 
-    if not isinstance(fixture_data, list):
-        return media_files
 
-    for obj in fixture_data:
-        if not isinstance(obj, dict) or 'model' not in obj or 'fields' not in obj:
-            continue
+@functools.lru_cache(maxsize=1)
+def _media_url_prefix():
+    """
+    The MEDIA_URL setting stripped to a "prefix/" form ready for
+    startswith checks, or an empty string when MEDIA_URL is unset.
 
-        model_name = obj['model']
-        fields = obj['fields']
+    Settings attribute access goes through LazySettings.__getattr__ on
+    every call, which adds up over millions of field values, so the
+    prefix is computed once and invalidated if the setting changes.
+    """
+    media_url = getattr(settings, 'MEDIA_URL', '') or ''
+    media_url = media_url.strip('/')
+    return media_url + '/' if media_url else ''
+
+
+@receiver(setting_changed)
+def _reset_media_url_prefix(sender, setting, **kwargs):
+    if setting == 'MEDIA_URL':
+        _media_url_prefix.cache_clear()
+
+
+def _normalize_media_path(field_value):
+    """
+    Normalize a file-field value from a fixture into a storage-relative
+    media path.
+
+    Handles both relative paths and full URLs, and strips the MEDIA_URL
+    prefix when present.
+
+    Args:
+        field_value: String value of a FileField/ImageField in the fixture
 
+    Returns:
+        The normalized media path, or None when the value is empty
+    """
+    if not field_value.strip():
+        return None
+
+    if field_value.startswith('http'):
+        # urlparse can raise on malformed values (e.g. invalid ports)
         try:
-            # Get the actual model class
-            app_label, model_class_name = model_name.split('.')
-            model_class = apps.get_model(app_label, model_class_name)
+            parsed_url = urlparse(field_value)
+        except ValueError:
+            return None
+        file_path = parsed_url.path.lstrip('/')
+    else:
+        file_path = field_value.lstrip('/')
 
-            # Check each field in the fixture
-            for field_name, field_value in fields.items():
-                if not field_value:
-                    continue
+    # Remove media URL prefix if present
+    media_prefix = _media_url_prefix()
+    if media_prefix and file_path.startswith(media_prefix):
+        file_path = file_path[len(media_prefix):]
 
-                try:
-                    # Get the field from the model
-                    field = model_class._meta.get_field(field_name)
-
-                    # Check if it's a FileField or ImageField
-                    if isinstance(field, (models.FileField, models.ImageField)):
-                        # Extract the file path (remove any URL prefixes)
-                        if isinstance(field_value, str) and field_value.strip():
-                            # Handle both relative paths and full URLs
-                            if field_value.startswith('http'):
-                                parsed_url = urlparse(field_value)
-                                file_path = parsed_url.path.lstrip('/')
-                            else:
-                                file_path = field_value.lstrip('/')
-
-                            # Remove media URL prefix if present
-                            if hasattr(settings, 'MEDIA_URL') and settings.MEDIA_URL:
-                                media_url = settings.MEDIA_URL.strip('/')
-                                if file_path.startswith(media_url + '/'):
-                                    file_path = file_path[len(media_url) + 1:]
-
-                            if file_path:
-                                media_files.add(file_path)
+    return file_path or None
 
-                except Exception as e:
-                    # Field might not exist or be accessible, skip it
-                    logger.debug(f"Could not process field {field_name} in {model_name}: {e}")
-                    continue
 
-        except Exception as e:
-            logger.debug(f"Could not process model {model_name}: {e}")
+def _iter_object_media_paths(obj, seen_raw):
+    """
+    Yield media file paths referenced by a single fixture object.
+
+    Args:
+        obj: Parsed fixture object ({model, fields} dict)
+        seen_raw: Set of raw field values already processed; repeats are
+            skipped before normalization so shared paths (e.g. default
+            thumbnails stored on many rows) are only parsed once
+
+    Yields:
+        Media file paths referenced by the object
+    """
+    if not isinstance(obj, dict) or 'model' not in obj or 'fields' not in obj:
+        return
+
+    # Skip objects of models without file fields entirely. The map keys
+    # come from _meta.model_name and are lowercase; fixture labels may
+    # carry the original class casing
+    file_field_names = _file_field_names_by_model().get(obj['model'].lower())
+    if not file_field_names:
+        return
+
+    # Check each file field present in the fixture
+    for field_name, field_value in obj['fields'].items():
+        if not field_value or field_name not in file_field_names:
             continue
 
+        if isinstance(field_value, str) and field_value not in seen_raw:
+            seen_raw.add(field_value)
+            file_path = _normalize_media_path(field_value)
+            if file_path:
+                yield file_path
+
+
+def extract_media_files_from_fixture(fixture_file_path):
+    """
+    Extract media file paths from a fixture file without loading it into memory.
+
+    Args:
+        fixture_file_path: Path to the JSON fixture file
+
+    Returns:
+        Set of media file paths referenced in the fixture
+    """
+    with open(fixture_file_path, 'rb', buffering=1 << 20) as f:
+        return set(iter_media_paths(iter_fixture_objects(f)))
+
+
+def get_max_parallel_media_transfers():
+    """
+    Get the number of worker threads to use for media file transfers.
+
+    Returns:
+        Number of parallel media transfers from BACKUPS settings (default 16)
+    """
+    return getattr(settings, 'BACKUPS', {}).get('MAX_PARALLEL_MEDIA_TRANSFERS', 16)
+
+
+@ijson.coroutine
+def _media_path_scanner(media_files):
+    """
+    Coroutine target that receives (prefix, event, value) parse events from
+    a fixture stream and collects referenced media paths into the given set.
+
+    Works directly on parser events instead of materialized per-object
+    dicts: dumpdata emits "model" before "fields" in every object, so the
+    scanner tracks the current object's file-field names and only inspects
+    string values under matching "item.fields.<name>" prefixes.
+
+    Raw field values are deduplicated before normalization: shared paths
+    (e.g. default thumbnails stored on many rows) would dedupe in the
+    result set anyway, but skipping repeats avoids re-running the URL
+    parsing per occurrence. The table is bounded by the number of
+    distinct file references in the fixture.
+    """
+    file_field_names = None
+    seen_raw = set()
+    while True:
+        prefix, event, value = (yield)
+        if event != 'string':
+            continue
+        if prefix == 'item.model':
+            # Map keys are lowercase (from _meta.model_name); fixture
+            # labels may carry the original class casing
+            file_field_names = _file_field_names_by_model().get(value.lower())
+        elif (
+            file_field_names
+            and prefix.startswith('item.fields.')
+            and prefix[len('item.fields.'):] in file_field_names
+            and value not in seen_raw
+        ):
+            seen_raw.add(value)
+            file_path = _normalize_media_path(value)
+            if file_path:
+                media_files.add(file_path)
+
+
+def write_fixture_to_archive(zipf, json_file_path):
+    """
+    Write the fixture file into an open zip archive while scanning it for
+    media file references in the same read pass.
+
+    Each chunk read from disk is both written to the archive entry and fed
+    to a push-mode ijson parser, so the fixture is only read once instead
+    of once for the scan and again for the archive write. The scan runs on
+    raw parse events rather than per-object dicts, avoiding an allocation
+    per fixture object.
+
+    Args:
+        zipf: Open ZipFile in write mode
+        json_file_path: Path to the JSON fixture file
+
+    Returns:
+        Set of media file paths referenced in the fixture
+    """
+    media_files = set()
+    collector = ijson.parse_coro(_media_path_scanner(media_files))
+
+    zinfo = zipfile.ZipInfo.from_file(json_file_path, "backup.json")
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+    with open(json_file_path, 'rb', buffering=1 << 20) as src, \
+            zipf.open(zinfo, 'w', force_zip64=True) as dst:
+        while True:
+            chunk = src.read(1 << 20)
+            if not chunk:
+                break
+            dst.write(chunk)
+            collector.send(chunk)
+    collector.close()
+
     return media_files
 
 
-def copy_media_files_to_backup(media_files, backup_dir):
+def add_media_files_to_archive(zipf, media_files):
     """
-    Copy media files to the backup directory, preserving the directory structure.
+    Stream media files from storage directly into an open zip archive,
+    preserving the directory structure under a "media/" folder.
     Handles both local filesystem and remote storage (S3, etc.) via Django's storage system.
 
+    Downloads run in a thread pool since the work is I/O-bound; each file is
+    spooled to a memory-backed temporary file and written into the archive
+    from the calling thread only, as ZipFile handles are not thread-safe.
+    Fetches are submitted in a sliding window of twice the worker count so
+    completed spools waiting on the single archive writer stay bounded
+    instead of accumulating one per remaining media file.
+
     Args:
-        media_files: Set of media file paths to copy
-        backup_dir: Directory where media files should be copied
+        zipf: Open ZipFile in write mode
+        media_files: Set of media file paths to add to the archive
 
     Returns:
         Dict with 'copied' and 'missing' file lists
@@ -117,36 +312,53 @@ def copy_media_files_to_backup(media_files, backup_dir):
     copied_files = []
     missing_files = []
 
-    backup_media_dir = Path(backup_dir) / 'media'
-    backup_media_dir.mkdir(parents=True, exist_ok=True)
-
-    for file_path in media_files:
-        dest_path = backup_media_dir / file_path
-
+    def _fetch_one(file_path):
         try:
-            # Check if file exists in the storage backend (local, S3, etc.)
-            if default_storage.exists(file_path):
-                # Create destination directory if it doesn't exist
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Open the file from storage (works with S3, local, etc.)
-                with default_storage.open(file_path, 'rb') as source_file:
-                    # Write to local backup directory
-                    with open(dest_path, 'wb') as dest_file:
-                        # Copy in chunks to handle large files efficiently
-                        for chunk in iter(lambda: source_file.read(8192), b''):
-                            dest_file.write(chunk)
-
-                copied_files.append(file_path)
-                logger.debug(f"Copied media file from storage: {file_path}")
+            # Open the file from storage directly (works with S3, local, etc.)
+            # without a prior exists() check, which costs an extra round-trip
+            # per file on remote backends
+            spool = tempfile.SpooledTemporaryFile(max_size=1 << 24)
+            with default_storage.open(file_path, 'rb') as source_file:
+                # Copy in 1 MiB chunks to match typical remote-storage part
+                # sizes and keep interpreter round-trips low
+                shutil.copyfileobj(source_file, spool, length=1024 * 1024)
+            spool.seek(0)
+            return file_path, spool
+
+        except FileNotFoundError:
+            logger.warning(f"Media file not found in storage: {file_path}")
+            return file_path, None
 
-            else:
-                missing_files.append(file_path)
-                logger.warning(f"Media file not found in storage: {file_path}")
+        except Exception as e:
+            logger.error(f"Error copying media file {file_path}: {e}")
+            return file_path, None
 
+    def _write_one(future):
+        file_path, spool = future.result()
+        if spool is None:
+            missing_files.append(file_path)
+            return
+
+        # Ensure all media files are placed inside "media/" folder in the archive
+        archive_media_path = f"media/{file_path}"
+        try:
+            with spool, zipf.open(archive_media_path, 'w', force_zip64=True) as dest_file:
+                shutil.copyfileobj(spool, dest_file, length=1024 * 1024)
+            copied_files.append(file_path)
+            logger.debug(f"Added to archive: {archive_media_path}")
         except Exception as e:
             missing_files.append(file_path)
-            logger.error(f"Error copying media file {file_path}: {e}")
+            logger.error(f"Error adding media file {file_path} to archive: {e}")
+
+    max_workers = get_max_parallel_media_transfers()
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for file_path in media_files:
+            pending.append(executor.submit(_fetch_one, file_path))
+            if len(pending) >= 2 * max_workers:
+                _write_one(pending.popleft())
+        while pending:
+            _write_one(pending.popleft())
 
     return {
         'copied': copied_files,
@@ -154,35 +366,73 @@ def copy_media_files_to_backup(media_files, backup_dir):
     }
 
 
-def create_backup_archive(json_file_path, backup_dir, archive_name):
+class _NonSeekableWriter:
     """
-    Create a zip archive containing the JSON backup and media files.
+    Write-only wrapper that reports the absolute number of bytes written
+    from tell() and refuses to seek.
+
+    Storage backends like S3 hand out file objects whose tell()/seek()
+    operate on a local spool buffer that is truncated as multipart parts
+    are flushed upstream. ZipFile probes the stream, concludes it is
+    seekable, and seeks back at close to patch entry headers — which on
+    such a buffer overwrites the wrong bytes and corrupts any archive
+    larger than one part. Raising on seek() forces ZipFile onto its
+    streaming path (data descriptors, no header rewrites).
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._offset = 0
+
+    def write(self, data):
+        self._fileobj.write(data)
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def seekable(self):
+        return False
+
+    def seek(self, offset, whence=0):
+        raise OSError("stream is write-only and not seekable")
+
+    def flush(self):
+        self._fileobj.flush()
+
+
+def write_backup_archive(fileobj, json_file_path):
+    """
+    Write a complete backup zip archive to an open binary file object.
+
+    The fixture is written into the archive and scanned for media file
+    references in a single read pass, and the referenced media files are
+    streamed from storage straight into the archive, so no intermediate
+    copy of the media tree is staged on local disk. The destination only
+    needs to support sequential writes, so this works for local files as
+    well as storage backends that stream uploads.
 
     Args:
+        fileobj: Writable binary file object to receive the archive
         json_file_path: Path to the JSON fixture file
-        backup_dir: Directory containing media files
-        archive_name: Name for the zip archive
 
     Returns:
-        Path to the created zip archive
+        Media copy result dict with 'copied' and 'missing' file lists
     """
-    archive_path = Path(backup_dir) / f"{archive_name}.zip"
-
-    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Add the JSON file to the root of the archive with standardized name
-        zipf.write(json_file_path, "backup.json")
-
-        # Add all media files in a "media" folder within the archive
-        media_dir = Path(backup_dir) / 'media'
-        if media_dir.exists():
-            for file_path in media_dir.rglob('*'):
-                if file_path.is_file():
-                    # Calculate relative path from media directory
-                    relative_path = file_path.relative_to(media_dir)
-                    # Ensure all media files are placed inside "media/" folder in the archive
-                    archive_media_path = f"media/{relative_path}"
-                    zipf.write(file_path, archive_media_path)
-                    logger.debug(f"Added to archive: {archive_media_path}")
+    # Store media uncompressed: images/videos are already compressed and
+    # deflating them burns CPU for no size reduction. The JSON entries
+    # compress very well, so they are deflated individually. ZIP64 is
+    # forced up front on streamed entries so archives that cross 4 GiB
+    # don't trigger a record rewrite at close time.
+    with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
+        # Add the JSON file to the root of the archive with standardized
+        # name, collecting media references in the same pass
+        media_files = write_fixture_to_archive(zipf, json_file_path)
+        logger.info(f"Found {len(media_files)} media files referenced in backup")
+
+        # Stream all media files into a "media" folder within the archive
+        media_copy_result = add_media_files_to_archive(zipf, media_files)
 
         # Add a manifest file with backup information
         manifest = {
@@ -194,9 +444,47 @@ def create_backup_archive(json_file_path, backup_dir, archive_name):
         }
 
         manifest_json = json.dumps(manifest, indent=2)
-        zipf.writestr('backup_manifest.json', manifest_json)
+        zipf.writestr('backup_manifest.json', manifest_json, compress_type=zipfile.ZIP_DEFLATED)
+
+    return media_copy_result
+
+
+def create_backup_archive(json_file_path, backup_dir, archive_name):
+    """
+    Create a zip archive containing the JSON backup and media files.
+
+    Args:
+        json_file_path: Path to the JSON fixture file
+        backup_dir: Directory where the archive should be created
+        archive_name: Name for the zip archive
+
+    Returns:
+        Tuple of (path to the created zip archive, media copy result dict)
+    """
+    archive_path = Path(backup_dir) / f"{archive_name}.zip"
+
+    with open(archive_path, 'wb') as archive_out:
+        media_copy_result = write_backup_archive(archive_out, json_file_path)
+
+    return archive_path, media_copy_result
+
 
-    return archive_path
+@functools.lru_cache(maxsize=1)
+def _all_app_labels():
+    """
+    Get the label of every installed app that defines models.
+
+    The app registry is frozen once Django has started, so the result is
+    computed once per process instead of on every backup.
+
+    Returns:
+        Tuple of app labels
+    """
+    return tuple(
+        app_config.label
+        for app_config in apps.get_app_configs()
+        if app_config.models_module is not None
+    )
 
 
 def get_models_for_backup_type(backup_type):
@@ -243,48 +531,209 @@ def get_excluded_fields_for_backup_type(backup_type):
     return backup_type_config.get('exclude_fields', {})
 
 
-def filter_excluded_fields_from_fixture(fixture_data, excluded_fields):
+def filter_excluded_fields_from_fixture(fixture_objects, excluded_fields):
     """
-    Remove excluded fields from fixture data.
+    Remove excluded fields from a stream of fixture objects.
 
     Args:
-        fixture_data: Parsed JSON fixture data (list of objects)
+        fixture_objects: Iterable of fixture objects ({model, fields} dicts)
         excluded_fields: Dict mapping model names to lists of excluded field names
 
-    Returns:
-        Filtered fixture data with excluded fields removed
+    Yields:
+        Fixture objects with excluded fields removed
     """
-    if not isinstance(fixture_data, list) or not excluded_fields:
-        return fixture_data
-
-    filtered_data = []
-
-    for obj in fixture_data:
+    for obj in fixture_objects:
         if not isinstance(obj, dict) or 'model' not in obj or 'fields' not in obj:
-            filtered_data.append(obj)
+            yield obj
             continue
 
         model_name = obj['model']
-        
+
         # Check if this model has excluded fields
         if model_name in excluded_fields:
             excluded_field_names = excluded_fields[model_name]
-            
+
             # Create a copy of the object and remove excluded fields
             filtered_obj = obj.copy()
             filtered_obj['fields'] = {
-                field_name: field_value 
+                field_name: field_value
                 for field_name, field_value in obj['fields'].items()
                 if field_name not in excluded_field_names
             }
-            
+
             logger.debug(f"Excluded fields {excluded_field_names} from {model_name}")
-            filtered_data.append(filtered_obj)
+            yield filtered_obj
         else:
             # No exclusions for this model, keep as is
-            filtered_data.append(obj)
+            yield obj
+
+
+def apply_field_exclusions_to_fixture_file(fixture_file_path, excluded_fields):
+    """
+    Rewrite a fixture file with excluded fields removed, one object at a time.
+
+    Args:
+        fixture_file_path: Path to the JSON fixture file to rewrite in place
+        excluded_fields: Dict mapping model names to lists of excluded field names
+    """
+    filtered_file_path = f"{fixture_file_path}.filtered"
+
+    with open(fixture_file_path, 'rb', buffering=1 << 20) as src, \
+            open(filtered_file_path, 'w') as dst:
+        dst.write('[')
+        for index, obj in enumerate(
+            filter_excluded_fields_from_fixture(iter_fixture_objects(src), excluded_fields)
+        ):
+            if index:
+                dst.write(',\n')
+            json.dump(obj, dst)
+        dst.write(']')
+
+    os.replace(filtered_file_path, fixture_file_path)
+
+
+def _run_backup(backup, tenant, target_file_path=None):
+    """
+    Run the backup pipeline for a Backup record: dump the fixture, apply
+    field exclusions, build the archive with media streamed from storage,
+    and attach the resulting file to the record.
+
+    Shared by the Celery task and the synchronous entry points so the
+    pipeline exists only once. The caller is responsible for tenant
+    context handling; started_at is expected to be persisted already.
+
+    Args:
+        backup: The Backup instance being processed
+        tenant: Optional tenant object for multi-tenant setups
+        target_file_path: Optional local path to also copy the archive to
+
+    Returns:
+        Dict with 'archive_name', 'final_file_path' and 'media_stats'
+    """
+    # Get models to backup based on backup type
+    models_to_backup = get_models_for_backup_type(backup.type)
+
+    # If models_to_backup is '*', backup all models. Plain dumpdata
+    # already dumps everything when given no labels; tenant_dumpdata
+    # needs explicit labels, so pass one per app instead of one per model
+    if models_to_backup == '*':
+        args = list(_all_app_labels()) if MULTI_TENANT_ENABLED and tenant else []
+    else:
+        # Use the specific models defined in the backup type
+        args = models_to_backup
+
+    logger.debug("Dumping models: %s", args)
+
+    # Create a temporary directory for the backup process
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file_path = os.path.join(temp_dir, 'backup.json')
+
+        # Set up options for the dumpdata command
+        options = {
+            'format': 'json',
+            'indent': 2,
+            'database': 'default',
+        }
+
+        # Write the fixture through a 4 MiB buffer to amortize write()
+        # syscalls on large dumps instead of the default 8 KiB buffer
+        with open(temp_file_path, 'w', buffering=4 * 1024 * 1024, encoding='utf-8') as fixture_out:
+            options['stdout'] = fixture_out
+
+            # If multi-tenant is enabled and we have a tenant, use tenant-specific commands
+            if MULTI_TENANT_ENABLED and tenant:
+                options['tenant_pk'] = tenant.pk
+                call_command('tenant_dumpdata', *args, **options)
+            else:
+                call_command('dumpdata', *args, **options)
+
+        # Get excluded fields configuration and filter the fixture file
+        excluded_fields = get_excluded_fields_for_backup_type(backup.type)
+        if excluded_fields:
+            logger.info(f"Applying field exclusions: {excluded_fields}")
+            apply_field_exclusions_to_fixture_file(temp_file_path, excluded_fields)
+
+        # Create backup filename
+        backup.finished_at = timezone.now()
+        if MULTI_TENANT_ENABLED and tenant:
+            archive_name = f'backup_{tenant.pk}_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
+        else:
+            archive_name = f'backup_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
+
+        # Build the zip archive with JSON data and media files streamed
+        # directly from storage
+        final_file_path = None
+        if target_file_path:
+            # A local copy was requested: build the archive at the target
+            # path, then upload that same file to the backup storage
+            target_dir = Path(target_file_path).parent
+            if not target_dir.exists():
+                target_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f'Created directory: {target_dir}')
+
+            with open(target_file_path, 'wb') as archive_out:
+                media_copy_result = write_backup_archive(archive_out, temp_file_path)
+            final_file_path = target_file_path
+
+            # save=False skips the implicit row UPDATE so the file, done
+            # and finished_at fields land in a single save below
+            with open(target_file_path, 'rb') as archive_file:
+                backup.file.save(
+                    name=f'{archive_name}.zip',
+                    content=File(archive_file),
+                    save=False
+                )
+        else:
+            # Stream the archive straight into the destination storage so
+            # the bytes are never staged on local disk and re-uploaded.
+            # The wrapper hides the storage file's seek support, which on
+            # remote backends only reflects a local spool buffer
+            storage = backup.file.storage
+            file_name = storage.get_available_name(
+                backup.file.field.generate_filename(backup, f'{archive_name}.zip')
+            )
+            try:
+                with storage.open(file_name, 'wb') as archive_out:
+                    media_copy_result = write_backup_archive(
+                        _NonSeekableWriter(archive_out), temp_file_path
+                    )
+            except Exception:
+                # Remote storages may finalize the partial upload when the
+                # file is closed; don't leave a corrupt object behind
+                try:
+                    storage.delete(file_name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete partial backup {file_name}: {e}")
+                raise
+            backup.file.name = file_name
+
+        logger.info(f"Copied {len(media_copy_result['copied'])} media files, "
+                   f"{len(media_copy_result['missing'])} files were missing")
+
+        backup.done = True
+        backup.save(update_fields=['file', 'done', 'finished_at'])
+
+        # Log backup statistics
+        logger.info(f"Backup completed: {archive_name}.zip")
+        logger.info(f"Media files: {len(media_copy_result['copied'])} copied, "
+                   f"{len(media_copy_result['missing'])} missing")
+        if media_copy_result['missing']:
+            logger.warning(f"Missing media files: {media_copy_result['missing']}")
+
+        # Cleanup old backups after successful backup creation
+        try:
+            deleted_count = cleanup_old_backups_for_type(backup.type)
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} old backups of type {backup.type}")
+        except Exception as e:
+            logger.warning(f"Failed to cleanup old backups: {e}")
+
+    return {
+        'archive_name': archive_name,
+        'final_file_path': final_file_path,
+        'media_stats': media_copy_result,
+    }
 
-    return filtered_data
 
 @shared_task(
     bind=True,
@@ -307,8 +756,14 @@ def process_backup(self, backup_pk):
         # Clear any existing tenant first
         unset_current_tenant()
 
-        backup = Backup.objects.get(pk=backup_pk)
-        tenant = getattr(backup, 'tenant', None) if MULTI_TENANT_ENABLED else None
+        if MULTI_TENANT_ENABLED:
+            # Join the tenant row in the same query instead of triggering a
+            # second SELECT when backup.tenant is first accessed
+            backup = Backup.objects.select_related('tenant').get(pk=backup_pk)
+            tenant = getattr(backup, 'tenant', None)
+        else:
+            backup = Backup.objects.get(pk=backup_pk)
+            tenant = None
         logger.info(f"Processing backup with ID: {backup_pk} for tenant: {tenant} of type: {backup.type}")
 
         # Set the tenant context
@@ -318,100 +773,7 @@ def process_backup(self, backup_pk):
         backup.started_at = timezone.now()
         backup.save(update_fields=['started_at'])
 
-        # Get models to backup based on backup type
-        models_to_backup = get_models_for_backup_type(backup.type)
-
-        # If models_to_backup is '*', backup all models
-        if models_to_backup == '*':
-            # Get all installed models
-            args = []
-            for app_config in apps.get_app_configs():
-                for model in app_config.get_models():
-                    model_name = f"{model._meta.app_label}.{model._meta.model_name}"
-                    args.append(model_name)
-        else:
-            # Use the specific models defined in the backup type
-            args = models_to_backup
-
-        print(args)
-
-        # Create a temporary directory for the backup process
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file_path = os.path.join(temp_dir, 'backup.json')
-
-            # Set up options for the dumpdata command
-            options = {
-                'output': temp_file_path,
-                'format': 'json',
-                'indent': 2,
-                'database': 'default',
-            }
-
-            # If multi-tenant is enabled and we have a tenant, use tenant-specific commands
-            if MULTI_TENANT_ENABLED and tenant:
-                options['tenant_pk'] = tenant.pk
-                call_command('tenant_dumpdata', *args, **options)
-            else:
-                call_command('dumpdata', *args, **options)
-
-            # Read the generated JSON file to extract media file references
-            with open(temp_file_path, 'r') as f:
-                fixture_data = json.load(f)
-
-            # Get excluded fields configuration and filter the fixture data
-            excluded_fields = get_excluded_fields_for_backup_type(backup.type)
-            if excluded_fields:
-                logger.info(f"Applying field exclusions: {excluded_fields}")
-                fixture_data = filter_excluded_fields_from_fixture(fixture_data, excluded_fields)
-                
-                # Write the filtered data back to the file
-                with open(temp_file_path, 'w') as f:
-                    json.dump(fixture_data, f, indent=2)
-
-            # Extract media files referenced in the fixture
-            media_files = extract_media_files_from_fixture(fixture_data)
-            logger.info(f"Found {len(media_files)} media files referenced in backup")
-
-            # Copy media files to backup directory
-            media_copy_result = copy_media_files_to_backup(media_files, temp_dir)
-            logger.info(f"Copied {len(media_copy_result['copied'])} media files, "
-                       f"{len(media_copy_result['missing'])} files were missing")
-
-            # Create backup filename
-            backup.finished_at = timezone.now()
-            if MULTI_TENANT_ENABLED and tenant:
-                archive_name = f'backup_{tenant.pk}_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
-            else:
-                archive_name = f'backup_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
-
-            # Create zip archive with JSON data and media files
-            archive_path = create_backup_archive(temp_file_path, temp_dir, archive_name)
-
-            # Save the zip archive as the backup file
-            with open(archive_path, 'rb') as archive_file:
-                backup.file.save(
-                    name=f'{archive_name}.zip',
-                    content=File(archive_file),
-                    save=True
-                )
-
-            backup.done = True
-            backup.save(update_fields=['file', 'done', 'finished_at'])
-
-            # Log backup statistics
-            logger.info(f"Backup completed: {archive_name}.zip")
-            logger.info(f"Media files: {len(media_copy_result['copied'])} copied, "
-                       f"{len(media_copy_result['missing'])} missing")
-            if media_copy_result['missing']:
-                logger.warning(f"Missing media files: {media_copy_result['missing']}")
-
-            # Cleanup old backups after successful backup creation
-            try:
-                deleted_count = cleanup_old_backups_for_type(backup.type)
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old backups of type {backup.type}")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup old backups: {e}")
+        _run_backup(backup, tenant)
 
         # Clean up tenant context
         unset_current_tenant()
@@ -521,7 +883,7 @@ def cleanup_old_backups_for_type(backup_type):
         raise
 
 
-def create_backup_synchronously(backup_type, target_file_path=None, tenant=None):
+def create_backup_synchronously(backup_type, target_file_path=None, tenant=None, name=None):
     """
     Create a backup synchronously without using Celery.
 
@@ -529,9 +891,10 @@ def create_backup_synchronously(backup_type, target_file_path=None, tenant=None)
         backup_type: The backup type from BACKUPS.BACKUP_TYPES settings
         target_file_path: Optional path where to save the backup file
         tenant: Optional tenant object for multi-tenant setups
+        name: Optional name for the backup record (auto-generated if omitted)
 
     Returns:
-        Dict with backup info: {'backup_id': int, 'file_path': str, 'archive_path': str}
+        Dict with backup info: {'backup_id': int, 'file_path': str, 'media_stats': dict}
     """
     try:
         # Clear any existing tenant first
@@ -539,141 +902,38 @@ def create_backup_synchronously(backup_type, target_file_path=None, tenant=None)
         if tenant and MULTI_TENANT_ENABLED:
             set_current_tenant(tenant)
 
-        # Generate backup name
-        timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
-        if tenant and MULTI_TENANT_ENABLED:
-            backup_name = f'Synchronous Backup - Tenant {tenant.pk} - {backup_type} - {timestamp}'
-        else:
-            backup_name = f'Synchronous Backup - {backup_type} - {timestamp}'
+        # Generate backup name if not provided
+        if not name:
+            timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
+            if tenant and MULTI_TENANT_ENABLED:
+                name = f'Synchronous Backup - Tenant {tenant.pk} - {backup_type} - {timestamp}'
+            else:
+                name = f'Synchronous Backup - {backup_type} - {timestamp}'
 
-        logger.info(f"Creating synchronous backup: {backup_name}")
+        logger.info(f"Creating synchronous backup: {name}")
 
         # Create backup record
         backup = Backup.objects.create(
-            name=backup_name,
+            name=name,
             type=backup_type
         )
 
         backup.started_at = timezone.now()
         backup.save(update_fields=['started_at'])
 
-        # Get models to backup based on backup type
-        models_to_backup = get_models_for_backup_type(backup_type)
-
-        # If models_to_backup is '*', backup all models
-        if models_to_backup == '*':
-            args = []
-            for app_config in apps.get_app_configs():
-                for model in app_config.get_models():
-                    model_name = f"{model._meta.app_label}.{model._meta.model_name}"
-                    args.append(model_name)
-        else:
-            args = models_to_backup
-
-        logger.info(f"Backing up models: {args}")
-
-        # Create a temporary directory for the backup process
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file_path = os.path.join(temp_dir, 'backup.json')
-
-            # Set up options for the dumpdata command
-            options = {
-                'output': temp_file_path,
-                'format': 'json',
-                'indent': 2,
-                'database': 'default',
-            }
-
-            # If multi-tenant is enabled and we have a tenant, use tenant-specific commands
-            if MULTI_TENANT_ENABLED and tenant:
-                options['tenant_pk'] = tenant.pk
-                call_command('tenant_dumpdata', *args, **options)
-            else:
-                call_command('dumpdata', *args, **options)
-
-            # Read the generated JSON file to extract media file references
-            with open(temp_file_path, 'r') as f:
-                fixture_data = json.load(f)
-
-            # Get excluded fields configuration and filter the fixture data
-            excluded_fields = get_excluded_fields_for_backup_type(backup_type)
-            if excluded_fields:
-                logger.info(f"Applying field exclusions: {excluded_fields}")
-                fixture_data = filter_excluded_fields_from_fixture(fixture_data, excluded_fields)
-                
-                # Write the filtered data back to the file
-                with open(temp_file_path, 'w') as f:
-                    json.dump(fixture_data, f, indent=2)
-
-            # Extract media files referenced in the fixture
-            media_files = extract_media_files_from_fixture(fixture_data)
-            logger.info(f"Found {len(media_files)} media files referenced in backup")
-
-            # Copy media files to backup directory
-            media_copy_result = copy_media_files_to_backup(media_files, temp_dir)
-            logger.info(f"Copied {len(media_copy_result['copied'])} media files, "
-                       f"{len(media_copy_result['missing'])} files were missing")
-
-            # Create backup filename
-            backup.finished_at = timezone.now()
-            if MULTI_TENANT_ENABLED and tenant:
-                archive_name = f'backup_{tenant.pk}_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
-            else:
-                archive_name = f'backup_{backup.type}_{backup.finished_at.strftime("%Y%m%d_%H%M%S")}'
-
-            # Create zip archive with JSON data and media files
-            archive_path = create_backup_archive(temp_file_path, temp_dir, archive_name)
-
-            # Save to target file path if specified
-            final_file_path = None
-            if target_file_path:
-                import shutil
-                from pathlib import Path
-
-                # Create target directory if it doesn't exist
-                target_path = Path(target_file_path)
-                target_dir = target_path.parent
-                if not target_dir.exists():
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    logger.info(f'Created directory: {target_dir}')
-
-                shutil.copy2(archive_path, target_file_path)
-                final_file_path = target_file_path
-
-            # Save the zip archive as the backup file for record keeping
-            with open(archive_path, 'rb') as archive_file:
-                backup.file.save(
-                    name=f'{archive_name}.zip',
-                    content=File(archive_file),
-                    save=True
-                )
-
-            backup.done = True
-            backup.save(update_fields=['file', 'done', 'finished_at'])
-
-            # Log backup statistics
-            logger.info(f"Backup completed: {archive_name}.zip")
-            logger.info(f"Media files: {len(media_copy_result['copied'])} copied, "
-                       f"{len(media_copy_result['missing'])} missing")
-            if media_copy_result['missing']:
-                logger.warning(f"Missing media files: {media_copy_result['missing']}")
-
-            # Cleanup old backups after successful backup creation
-            try:
-                deleted_count = cleanup_old_backups_for_type(backup_type)
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old backups of type {backup_type}")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup old backups: {e}")
+        result = _run_backup(
+            backup,
+            tenant if MULTI_TENANT_ENABLED else None,
+            target_file_path=target_file_path,
+        )
 
         # Clean up tenant context
         unset_current_tenant()
 
         return {
             'backup_id': backup.id,
-            'file_path': final_file_path or backup.file.path,
-            'archive_path': str(archive_path),
-            'media_stats': media_copy_result
+            'file_path': result['final_file_path'] or backup.file.name,
+            'media_stats': result['media_stats']
         }
 
     except Exception as exc:
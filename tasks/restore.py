@@ -18,6 +18,7 @@ from django.db.models import ForeignKey
 from django.utils import timezone
 
 from superapp.apps.backups.models.restore import Restore
+from superapp.apps.backups.tasks.backup import _file_field_names_by_model
 
 # Conditional imports for multi-tenant support
 try:
@@ -60,6 +61,33 @@ def extract_backup_archive(archive_path, extract_dir):
     return str(json_file_path)
 
 
+def _iter_media_files(media_dir):
+    """
+    Recursively yield (full_path, relative_path) pairs for every file under
+    a media directory.
+
+    Uses os.scandir instead of Path.rglob: DirEntry caches the stat result
+    from the directory listing, so each entry is classified without a second
+    stat call or a per-entry Path allocation.
+
+    Args:
+        media_dir: Directory to walk
+
+    Yields:
+        Tuples of (absolute file path, path relative to media_dir with
+        forward slashes)
+    """
+    stack = [(str(media_dir), '')]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{rel_prefix}{entry.name}/"))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, f"{rel_prefix}{entry.name}"
+
+
 def restore_media_files_after_loaddata(extract_dir, backup_data):
     """
     Restore media files from extracted archive and update file fields in the database.
@@ -82,29 +110,24 @@ def restore_media_files_after_loaddata(extract_dir, backup_data):
 
     # First, restore all media files to storage
     logger.info("Restoring media files to storage...")
-    for file_path in media_dir.rglob('*'):
-        if file_path.is_file():
-            # Calculate relative path from media directory
-            relative_path = file_path.relative_to(media_dir)
-            storage_path = str(relative_path).replace('\\', '/')  # Ensure forward slashes
-
-            try:
-                # Read the file content
-                with open(file_path, 'rb') as f:
-                    file_content = f.read()
-
-                # Save to Django storage (handles local, S3, etc.)
-                if default_storage.exists(storage_path):
-                    # Delete existing file first
-                    default_storage.delete(storage_path)
-
-                default_storage.save(storage_path, ContentFile(file_content))
-                restored_files.append(storage_path)
-                logger.debug(f"Restored media file: {storage_path}")
-
-            except Exception as e:
-                failed_files.append(storage_path)
-                logger.error(f"Failed to restore media file {storage_path}: {e}")
+    for file_path, storage_path in _iter_media_files(media_dir):
+        try:
+            # Read the file content
+            with open(file_path, 'rb') as f:
+                file_content = f.read()
+
+            # Save to Django storage (handles local, S3, etc.)
+            if default_storage.exists(storage_path):
+                # Delete existing file first
+                default_storage.delete(storage_path)
+
+            default_storage.save(storage_path, ContentFile(file_content))
+            restored_files.append(storage_path)
+            logger.debug(f"Restored media file: {storage_path}")
+
+        except Exception as e:
+            failed_files.append(storage_path)
+            logger.error(f"Failed to restore media file {storage_path}: {e}")
 
     # Second, update file fields in database objects
     logger.info("Updating file fields in database objects...")
@@ -131,29 +154,22 @@ def _extract_file_field_references(backup_data):
 
     for obj_data in backup_data:
         model_name = obj_data['model']
-        pk = obj_data['pk']
-        fields = obj_data['fields']
 
-        try:
-            app_label, model_class_name = model_name.split('.')
-            model_class = apps.get_model(app_label, model_class_name)
-
-            # Check each field to see if it's a file field
-            for field_name, field_value in fields.items():
-                try:
-                    field = model_class._meta.get_field(field_name)
-                    # Check if it's a FileField or ImageField
-                    if hasattr(field, 'upload_to') and field_value:
-                        file_field_references[model_name][pk][field_name] = field_value
-                        logger.debug(f"Found file field: {model_name}[{pk}].{field_name} = {field_value}")
-                except Exception:
-                    # Field doesn't exist or isn't a file field, skip
-                    continue
-
-        except (ValueError, LookupError):
-            # Model doesn't exist, skip
+        # Unknown models and models without file fields resolve to None,
+        # so their objects are skipped with a single dict lookup instead
+        # of raising per field. Lowercase the label first: the map keys
+        # come from _meta.model_name, while user-supplied fixtures may
+        # spell the model with its original class casing
+        file_field_names = _file_field_names_by_model().get(model_name.lower())
+        if not file_field_names:
             continue
 
+        pk = obj_data['pk']
+        for field_name, field_value in obj_data['fields'].items():
+            if field_value and field_name in file_field_names:
+                file_field_references[model_name][pk][field_name] = field_value
+                logger.debug(f"Found file field: {model_name}[{pk}].{field_name} = {field_value}")
+
     return file_field_references
 
 
@@ -358,9 +374,9 @@ def process_restore(self, restore_pk):
                 temp_source_path = temp_file.name
 
                 with source_file.open('rb') as src:
-                    # Copy file content in chunks to avoid memory issues
-                    for chunk in src.chunks():
-                        temp_file.write(chunk)
+                    # Copy in 1 MiB chunks to avoid memory issues without
+                    # paying a Python round-trip per small chunk
+                    shutil.copyfileobj(src, temp_file, length=1024 * 1024)
 
                 # Ensure data is written to disk before returning
                 temp_file.flush()
@@ -380,7 +396,7 @@ def process_restore(self, restore_pk):
 
                 # Check if media directory exists
                 media_dir = Path(temp_dir) / 'media'
-                has_media_files = media_dir.exists() and any(media_dir.rglob('*'))
+                has_media_files = media_dir.exists() and any(_iter_media_files(media_dir))
                 logger.info(f"Archive contains media files: {has_media_files}")
 
             else: